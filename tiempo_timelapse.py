@@ -1,9 +1,30 @@
 import sys
-import io
+import os
 import json
 import re
+import asyncio
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+    import qasync
+except Exception:
+    aiohttp = None
+    qasync = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import numba
+except Exception:
+    numba = None
 
 from PyQt5.QtCore import (
     Qt,
@@ -16,11 +37,12 @@ from PyQt5.QtCore import (
     QUrl,
     pyqtSignal,
     QObject,
-    QBuffer,
-    QIODevice,
     QSettings,
+    QThread,
+    QThreadPool,
+    QRunnable,
 )
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QImage
+from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QImage, QImageReader
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -43,7 +65,12 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QMessageBox,
 )
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt5.QtNetwork import (
+    QNetworkAccessManager,
+    QNetworkDiskCache,
+    QNetworkRequest,
+    QNetworkReply,
+)
 
 
 APP_ORG = "tiempo"
@@ -55,13 +82,75 @@ BASE_URL = (
 SPEED_PRESETS = [250, 500, 1000, 2000]
 LOOP_MODES = ["Loop", "Ping-pong", "Stop"]
 DEFAULT_MAX_CONCURRENT = 4
+HTTP2_MAX_CONCURRENT = 8
+ASYNC_MAX_CONCURRENT = 16
 NEIGHBOR_PREFETCH = 2
+EXPORT_PIPELINE_DEPTH = 8
+# A completed refresh younger than this is trusted without re-probing
+# the server, as long as the forecast cycle has not advanced.
+REFRESH_FRESH_SECS = 300
 
 
 def build_offsets():
     return list(range(6, 241, 6))
 
 
+def clip_rect(origin_x, origin_y, current_x, current_y, max_w, max_h):
+    """Normalize and clip a drag rectangle to the pixmap bounds in one pass."""
+    x0 = min(origin_x, current_x)
+    y0 = min(origin_y, current_y)
+    x1 = max(origin_x, current_x)
+    y1 = max(origin_y, current_y)
+    x0 = max(0.0, x0)
+    y0 = max(0.0, y0)
+    x1 = min(float(max_w), x1)
+    y1 = min(float(max_h), y1)
+    return x0, y0, max(0.0, x1 - x0), max(0.0, y1 - y0)
+
+
+def _bgra_to_rgb_crop(src, stride, x0, y0, dst):
+    # Fused BGRA -> RGB conversion and crop; only called through the
+    # njit wrapper below, the numpy slice path covers the fallback.
+    for y in range(dst.shape[0]):
+        row = (y0 + y) * stride
+        for x in range(dst.shape[1]):
+            p = row + (x0 + x) * 4
+            dst[y, x, 0] = src[p + 2]
+            dst[y, x, 1] = src[p + 1]
+            dst[y, x, 2] = src[p]
+
+
+if numba is not None:
+    clip_rect = numba.njit(cache=True, nogil=True)(clip_rect)
+    _bgra_to_rgb_crop = numba.njit(cache=True, nogil=True)(_bgra_to_rgb_crop)
+
+
+@lru_cache(maxsize=256)
+def _rect_to_ratio_cached(x, y, w, h, width, height):
+    return (x / width, y / height, w / width, h / height)
+
+
+@lru_cache(maxsize=256)
+def _ratio_to_rect_cached(width, height, rx, ry, rw, rh):
+    # All forecast frames share one size, so a region preset applied
+    # while scrubbing resolves to the same rect every frame; memoizing
+    # on the inputs alone is enough because the math is pure.
+    x = max(0, min(width - 1, int(rx * width)))
+    y = max(0, min(height - 1, int(ry * height)))
+    w = max(1, min(width - x, int(rw * width)))
+    h = max(1, min(height - y, int(rh * height)))
+    return (x, y, w, h)
+
+
+def json_dumps_compact(data):
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "on"})
+
+
 def bool_value(value, default=False):
     if value is None:
         return default
@@ -70,7 +159,7 @@ def bool_value(value, default=False):
     if isinstance(value, (int, float)):
         return bool(value)
     if isinstance(value, str):
-        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+        return value.strip().lower() in TRUE_STRINGS
     return default
 
 
@@ -82,15 +171,17 @@ def last_cycle_utc(now=None):
     return QDateTime(now.date(), QTime(cycle_hour, 0), Qt.UTC)
 
 
+DATETIME_PATTERNS = [
+    (re.compile(r"(\d{2})[/-](\d{2})[/-](\d{4}).*?(\d{2}):(\d{2})"), "DMY"),
+    (re.compile(r"(\d{4})[/-](\d{2})[/-](\d{2}).*?(\d{2}):(\d{2})"), "YMD"),
+]
+
+
 def parse_datetime_from_text(text):
     if not text:
         return None
-    patterns = [
-        (r"(\d{2})[/-](\d{2})[/-](\d{4}).*?(\d{2}):(\d{2})", "DMY"),
-        (r"(\d{4})[/-](\d{2})[/-](\d{2}).*?(\d{2}):(\d{2})", "YMD"),
-    ]
-    for pattern, order in patterns:
-        match = re.search(pattern, text)
+    for pattern, order in DATETIME_PATTERNS:
+        match = pattern.search(text)
         if not match:
             continue
         parts = [int(value) for value in match.groups()]
@@ -105,16 +196,46 @@ def parse_datetime_from_text(text):
     return None
 
 
-def try_ocr_datetime(pixmap):
+OCR_TESSERACT_CONFIG = "--psm 7 -c tessedit_char_whitelist=0123456789:/-"
+
+
+def adaptive_threshold(gray, block=15, c=8):
+    """Binarize a grayscale ndarray against a local box-filter mean.
+
+    Timestamps sit on a noisy map background, so a global contrast
+    stretch is a poor preprocessor; comparing each pixel against the
+    mean of its block-sized neighbourhood (via an integral image, so
+    the whole pass is O(N)) isolates the dark glyphs cleanly.
+    """
+    import numpy as np
+
+    pad = block // 2
+    padded = np.pad(gray.astype(np.float32), pad, mode="edge")
+    integral = np.pad(padded.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    height, width = gray.shape
+    window_sum = (
+        integral[block : block + height, block : block + width]
+        - integral[block : block + height, :width]
+        - integral[:height, block : block + width]
+        + integral[:height, :width]
+    )
+    mean = window_sum / float(block * block)
+    return np.where(gray > mean - c, 255, 0).astype(np.uint8)
+
+
+def ocr_datetime_from_image(qimage):
     try:
         from PIL import Image, ImageOps
         import pytesseract
     except Exception:
         return None
+    try:
+        import numpy as np
+    except Exception:
+        np = None
 
-    if pixmap is None or pixmap.isNull():
+    if qimage is None or qimage.isNull():
         return None
-    qimage = pixmap.toImage()
     width = qimage.width()
     height = qimage.height()
     if width <= 0 or height <= 0:
@@ -123,35 +244,242 @@ def try_ocr_datetime(pixmap):
     if crop_rect.width() <= 0 or crop_rect.height() <= 0:
         return None
     crop = qimage.copy(crop_rect)
-    buffer = QBuffer()
-    buffer.open(QIODevice.WriteOnly)
-    crop.save(buffer, "PNG")
-    pil_image = Image.open(io.BytesIO(buffer.data()))
-    pil_image = ImageOps.autocontrast(pil_image.convert("L"))
-    text = pytesseract.image_to_string(pil_image, config="--psm 6")
+    if np is not None:
+        crop = crop.convertToFormat(QImage.Format_Grayscale8)
+        ptr = crop.bits()
+        ptr.setsize(crop.byteCount())
+        gray = np.frombuffer(ptr, dtype=np.uint8).reshape(
+            crop.height(), crop.bytesPerLine()
+        )[:, : crop.width()]
+        # Tesseract's setup cost dominates on blank crops; bail out when
+        # the region clearly holds no dark-on-light text, and shrink the
+        # box to the rows/columns that actually contain dark pixels.
+        dark = gray < 80
+        dark_frac = dark.mean()
+        if dark_frac < 0.01 or dark_frac > 0.5:
+            return None
+        rows = np.flatnonzero(dark.any(axis=1))
+        cols = np.flatnonzero(dark.any(axis=0))
+        gray = gray[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1]
+        binary = adaptive_threshold(gray)
+        text = pytesseract.image_to_string(
+            Image.fromarray(binary), config=OCR_TESSERACT_CONFIG
+        )
+    else:
+        # Both sides live in the same process, so hand PIL the raw
+        # grayscale buffer instead of encoding and re-decoding a PNG.
+        crop = crop.convertToFormat(QImage.Format_Grayscale8)
+        ptr = crop.constBits()
+        ptr.setsize(crop.byteCount())
+        pil_image = Image.frombuffer(
+            "L",
+            (crop.width(), crop.height()),
+            bytes(ptr),
+            "raw",
+            "L",
+            crop.bytesPerLine(),
+            1,
+        )
+        pil_image = ImageOps.autocontrast(pil_image)
+        text = pytesseract.image_to_string(pil_image, config="--psm 6")
     return parse_datetime_from_text(text)
 
 
-def pixmap_to_pil(pixmap):
+def try_ocr_datetime(pixmap):
+    if pixmap is None or pixmap.isNull():
+        return None
+    return ocr_datetime_from_image(pixmap.toImage())
+
+
+class _PngSaveSignals(QObject):
+    saved = pyqtSignal(str, bool)
+
+
+class _PngSaveTask(QRunnable):
+    """Encode and write a snapshot PNG off the GUI thread."""
+
+    def __init__(self, image, path):
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.signals = _PngSaveSignals()
+
+    def run(self):
+        ok = self.image.save(self.path, "PNG")
+        self.signals.saved.emit(self.path, ok)
+
+
+class _OcrSignals(QObject):
+    done = pyqtSignal(int, int, QDateTime)
+
+
+class _OcrTask(QRunnable):
+    """Run timestamp OCR off the GUI thread.
+
+    Tesseract easily takes hundreds of milliseconds, exactly while
+    frames are streaming in. The result carries a generation counter so
+    stale detections from a previous refresh are dropped; an invalid
+    QDateTime means nothing was read.
+    """
+
+    def __init__(self, generation, offset, image):
+        super().__init__()
+        self.generation = generation
+        self.offset = offset
+        self.image = image
+        self.signals = _OcrSignals()
+
+    def run(self):
+        ocr_dt = ocr_datetime_from_image(self.image)
+        self.signals.done.emit(
+            self.generation, self.offset, ocr_dt or QDateTime()
+        )
+
+
+def qimage_to_pil(qimage):
     try:
         from PIL import Image
     except Exception:
         return None
+    try:
+        import numpy as np
+    except Exception:
+        np = None
 
-    if pixmap is None or pixmap.isNull():
+    if qimage is None or qimage.isNull():
         return None
-    qimage = pixmap.toImage()
     if qimage.format() not in (QImage.Format_RGB888, QImage.Format_RGBA8888):
         qimage = qimage.convertToFormat(QImage.Format_RGBA8888)
     mode = "RGB" if qimage.format() == QImage.Format_RGB888 else "RGBA"
+    channels = 3 if mode == "RGB" else 4
     width = qimage.width()
     height = qimage.height()
     ptr = qimage.bits()
     ptr.setsize(qimage.byteCount())
-    return Image.frombuffer(mode, (width, height), bytes(ptr), "raw", mode, 0, 1)
+    if np is not None:
+        rows = np.frombuffer(ptr, dtype=np.uint8).reshape(
+            height, qimage.bytesPerLine()
+        )
+        arr = np.empty((height, width, channels), dtype=np.uint8)
+        np.copyto(arr.reshape(height, width * channels), rows[:, : width * channels])
+        return Image.fromarray(arr, mode)
+    return Image.frombuffer(
+        mode, (width, height), bytes(ptr), "raw", mode, qimage.bytesPerLine(), 1
+    )
+
+
+def pixmap_to_pil(pixmap):
+    if pixmap is None or pixmap.isNull():
+        return None
+    return qimage_to_pil(pixmap.toImage())
+
+
+def qimage_to_rgb_ndarray(qimage, crop=None):
+    """Copy a QImage into an (H, W, 3) uint8 array in a single pass.
+
+    Converts to RGB888 and copies row payloads straight out of the Qt
+    buffer, skipping Qt's 4-byte row padding, so the encoders get one
+    contiguous copy instead of the QImage -> PIL -> ndarray chain.
+    With a crop of (x, y, w, h) only that region is materialized. A
+    source that already sits in (A)RGB32 — typical after a QPixmap
+    round trip — goes through the fused numba swizzle-and-crop kernel
+    instead of a full-frame format conversion; RGB888 sources (the
+    ingestion format) never need a swizzle, so they just copy the crop
+    rows. Returns None when numpy is missing.
+    """
+    try:
+        import numpy as np
+    except Exception:
+        return None
+
+    if qimage is None or qimage.isNull():
+        return None
+    if (
+        crop is not None
+        and numba is not None
+        and sys.byteorder == "little"
+        and qimage.format() in (QImage.Format_ARGB32, QImage.Format_RGB32)
+    ):
+        # (A)RGB32 is stored native-endian, i.e. BGRA bytes on little-
+        # endian hosts — the only layout the kernel handles.
+        ptr = qimage.constBits()
+        ptr.setsize(qimage.byteCount())
+        src = np.frombuffer(ptr, dtype=np.uint8)
+        x0, y0, crop_w, crop_h = crop
+        dst = np.empty((crop_h, crop_w, 3), dtype=np.uint8)
+        _bgra_to_rgb_crop(src, qimage.bytesPerLine(), x0, y0, dst)
+        return dst
+    image = qimage.convertToFormat(QImage.Format_RGB888)
+    height = image.height()
+    width = image.width()
+    ptr = image.constBits()
+    ptr.setsize(image.byteCount())
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape(
+        height, image.bytesPerLine()
+    )
+    if crop is not None:
+        x0, y0, crop_w, crop_h = crop
+        return np.ascontiguousarray(
+            rows[y0 : y0 + crop_h, x0 * 3 : (x0 + crop_w) * 3]
+        ).reshape(crop_h, crop_w, 3)
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    np.copyto(arr.reshape(height, width * 3), rows[:, : width * 3])
+    return arr
+
+
+def read_cached_image(path, target_size=None):
+    """Decode a cached PNG, optionally directly at display size.
+
+    QImageReader.setScaledSize lets libpng skip rows during decode, so a
+    frame shown in a small viewport never pays for full-resolution
+    pixels. Only downscaling is requested; upscaling is left to the
+    view.
+    """
+    reader = QImageReader(str(path))
+    if target_size is not None and not target_size.isEmpty():
+        source = reader.size()
+        if source.isValid():
+            scaled = source.scaled(target_size, Qt.KeepAspectRatio)
+            if scaled.width() < source.width():
+                reader.setScaledSize(scaled)
+    image = reader.read()
+    if not image.isNull() and image.format() != QImage.Format_RGB888:
+        # Normalizing at ingestion keeps pixmap_to_pil and the export
+        # tensor packing from paying a per-frame ARGB32 conversion.
+        image = image.convertToFormat(QImage.Format_RGB888)
+    return image
+
+
+class _FrameLoadSignals(QObject):
+    loaded = pyqtSignal(int, QImage)
+    failed = pyqtSignal(int)
+
+
+class _FrameLoadTask(QRunnable):
+    """Decode one cached PNG off the GUI thread.
+
+    QImage decoding is thread-safe; the QPixmap conversion happens in
+    the receiving slot on the main thread.
+    """
+
+    def __init__(self, offset, path, target_size=None):
+        super().__init__()
+        self.offset = offset
+        self.path = path
+        self.target_size = target_size
+        self.signals = _FrameLoadSignals()
+
+    def run(self):
+        image = read_cached_image(self.path, self.target_size)
+        if not image.isNull():
+            self.signals.loaded.emit(self.offset, image)
+        else:
+            self.signals.failed.emit(self.offset)
 
 
 class ForecastCache:
+    __slots__ = ("cache_dir",)
+
     def __init__(self, cache_dir):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -159,21 +487,66 @@ class ForecastCache:
     def path_for(self, offset):
         return self.cache_dir / f"ECMWF_{offset:03d}.png"
 
-    def load(self, offset):
+    def load(self, offset, target_size=None):
         path = self.path_for(offset)
         if not path.exists():
             return None
-        pixmap = QPixmap(str(path))
+        image = read_cached_image(path, target_size)
+        if image.isNull():
+            return None
+        pixmap = QPixmap.fromImage(image)
         if pixmap.isNull():
             return None
         return pixmap
 
+    def load_async(self, offset, on_loaded, on_failed=None, target_size=None):
+        path = self.path_for(offset)
+        if not path.exists():
+            return False
+        task = _FrameLoadTask(offset, path, target_size)
+        task.signals.loaded.connect(on_loaded)
+        if on_failed is not None:
+            task.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+        return True
+
     def save(self, offset, pixmap):
         path = self.path_for(offset)
         pixmap.save(str(path), "PNG")
 
 
+class _AtomicWriteTask(QRunnable):
+    """Write text to a path atomically (tempfile + os.replace) off the GUI
+    thread so batch completion never blocks on a disk sync."""
+
+    def __init__(self, path, payload):
+        super().__init__()
+        self.path = Path(path)
+        self.payload = payload
+
+    def run(self):
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                delete=False,
+            ) as handle:
+                handle.write(self.payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+                tmp_name = handle.name
+            os.replace(tmp_name, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except (OSError, UnboundLocalError):
+                pass
+
+
 class MetadataCache:
+    __slots__ = ("path", "data", "_dirty")
+
     def __init__(self, path):
         self.path = Path(path)
         self.data = {}
@@ -188,14 +561,8 @@ class MetadataCache:
         except Exception:
             self.data = {}
 
-    def headers_for(self, offset):
-        entry = self.data.get(str(offset), {})
-        headers = {}
-        if "etag" in entry:
-            headers["etag"] = entry["etag"]
-        if "last_modified" in entry:
-            headers["last_modified"] = entry["last_modified"]
-        return headers
+    def last_modified_for(self, offset):
+        return self.data.get(str(offset), {}).get("last_modified")
 
     def update(self, offset, etag=None, last_modified=None):
         entry = self.data.setdefault(str(offset), {})
@@ -208,10 +575,41 @@ class MetadataCache:
     def save(self):
         if not self._dirty:
             return
-        self.path.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+        payload = json_dumps_compact(self.data)
+        QThreadPool.globalInstance().start(_AtomicWriteTask(self.path, payload))
         self._dirty = False
 
 
+class _ReplyDecodeSignals(QObject):
+    decoded = pyqtSignal(int, QImage, dict)
+    failed = pyqtSignal(int, str)
+
+
+class _ReplyDecodeTask(QRunnable):
+    """Decode downloaded PNG bytes off the GUI thread.
+
+    With 40 images per refresh the libpng decodes add up to hundreds of
+    milliseconds; running them on the pool keeps the UI responsive and
+    spreads the work across cores.
+    """
+
+    def __init__(self, offset, data, meta):
+        super().__init__()
+        self.offset = offset
+        self.data = data
+        self.meta = meta
+        self.signals = _ReplyDecodeSignals()
+
+    def run(self):
+        image = QImage()
+        if image.loadFromData(self.data, "PNG") and not image.isNull():
+            if image.format() != QImage.Format_RGB888:
+                image = image.convertToFormat(QImage.Format_RGB888)
+            self.signals.decoded.emit(self.offset, image, self.meta)
+        else:
+            self.signals.failed.emit(self.offset, "invalid image data")
+
+
 class ImageFetcher(QObject):
     imageLoaded = pyqtSignal(int, QPixmap, dict)
     notModified = pyqtSignal(int)
@@ -219,34 +617,168 @@ class ImageFetcher(QObject):
     progressChanged = pyqtSignal(int, int)
     batchFinished = pyqtSignal()
 
-    def __init__(self, base_url, parent=None):
+    def __init__(self, base_url, cache_dir=None, parent=None):
         super().__init__(parent)
         self.base_url = base_url
+        # One QNetworkAccessManager for the app's lifetime: it owns the
+        # connection pool, so recreating it per batch would defeat
+        # keep-alive and HTTP/2 session reuse.
         self.manager = QNetworkAccessManager(self)
+        if cache_dir is not None:
+            disk_cache = QNetworkDiskCache(self)
+            disk_cache.setCacheDirectory(str(Path(cache_dir) / "http"))
+            self.manager.setCache(disk_cache)
         self.manager.finished.connect(self._on_finished)
         self._queue = deque()
-        self._headers_by_offset = {}
         self._in_flight = 0
         self._done = 0
         self._total = 0
         self._max_concurrent = DEFAULT_MAX_CONCURRENT
         self._force_network = False
+        self._http2_detected = False
+        self._probe_expected = None
+        self._batch_task = None
+        self._decodes_pending = 0
+        self._network_done = False
 
     def set_max_concurrent(self, value):
         self._max_concurrent = max(1, int(value))
 
-    def fetch_offsets(self, offsets, headers_by_offset=None, force_network=False):
-        self._queue = deque(offsets)
-        self._headers_by_offset = headers_by_offset or {}
+    def fetch_offsets(self, offsets, force_network=False, probe_last_modified=None):
+        """Fetch the given offsets, newest metadata first.
+
+        ECMWF publishes all offsets of a cycle atomically, so when the
+        caller knows the Last-Modified of any frame from the previous
+        refresh, a single HEAD on the first offset can prove the whole
+        cycle unchanged and replace the full batch of GETs.
+        """
+        self._queue.clear()
+        self._queue.extend(offsets)
         self._force_network = force_network
         self._in_flight = 0
         self._done = 0
         self._total = len(offsets)
+        self._network_done = False
         if self._total == 0:
             self.batchFinished.emit()
             return
+        if force_network:
+            probe_last_modified = None
+        if self._async_available():
+            # asyncio keeps only a weak reference to running tasks, so
+            # anchor it here; the done callback keeps a failed batch
+            # from leaving the caller's refresh latch stuck forever.
+            self._batch_task = asyncio.ensure_future(
+                self._run_batch(list(offsets), probe_last_modified)
+            )
+            self._batch_task.add_done_callback(self._on_batch_task_done)
+            return
+        if probe_last_modified:
+            self._probe_expected = probe_last_modified
+            request = QNetworkRequest(
+                QUrl(self.base_url.format(hour=offsets[0]))
+            )
+            request.setAttribute(
+                QNetworkRequest.CacheLoadControlAttribute,
+                QNetworkRequest.AlwaysNetwork,
+            )
+            reply = self.manager.head(request)
+            reply.setProperty("probe", True)
+            return
         self._start_more()
 
+    def _finish_unchanged_batch(self):
+        while self._queue:
+            offset = self._queue.popleft()
+            self.notModified.emit(offset)
+            self._done += 1
+            self.progressChanged.emit(self._done, self._total)
+        self._finish_network_batch()
+
+    def _on_probe_finished(self, reply):
+        last_modified = bytes(reply.rawHeader(b"Last-Modified")).decode(
+            "utf-8", "ignore"
+        ).strip()
+        reply.deleteLater()
+        if (
+            reply.error() == QNetworkReply.NoError
+            and last_modified
+            and last_modified == self._probe_expected
+        ):
+            self._finish_unchanged_batch()
+        else:
+            self._start_more()
+
+    def _on_batch_task_done(self, task):
+        self._batch_task = None
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            # _run_batch ends the batch itself on the normal paths; an
+            # escaped exception must still end it.
+            self.imageError.emit(-1, str(exc))
+            self._finish_network_batch()
+
+    @staticmethod
+    def _async_available():
+        if aiohttp is None or qasync is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    async def _run_batch(self, offsets, probe_last_modified=None):
+        connector = aiohttp.TCPConnector(limit=ASYNC_MAX_CONCURRENT)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            if probe_last_modified:
+                try:
+                    async with session.head(
+                        self.base_url.format(hour=offsets[0])
+                    ) as response:
+                        last_modified = response.headers.get(
+                            "Last-Modified", ""
+                        ).strip()
+                except Exception:
+                    last_modified = ""
+                if last_modified and last_modified == probe_last_modified:
+                    self._finish_unchanged_batch()
+                    return
+            await asyncio.gather(
+                *(self._fetch_one(session, offset) for offset in offsets)
+            )
+        self._finish_network_batch()
+
+    async def _fetch_one(self, session, offset):
+        # qasync runs the asyncio loop on the Qt main thread, so emitting
+        # signals directly from here is safe.
+        url = self.base_url.format(hour=offset)
+        try:
+            async with session.get(url) as response:
+                data = await response.read()
+                status = response.status
+                meta = {}
+                etag = response.headers.get("ETag", "").strip()
+                last_modified = response.headers.get("Last-Modified", "").strip()
+                if etag:
+                    meta["etag"] = etag
+                if last_modified:
+                    meta["last_modified"] = last_modified
+        except Exception as exc:
+            self.imageError.emit(offset, str(exc))
+        else:
+            if status == 304:
+                self.notModified.emit(offset)
+            elif status == 200:
+                self._decode_async(offset, data, meta)
+            else:
+                self.imageError.emit(offset, f"HTTP {status}")
+        finally:
+            self._done += 1
+            self.progressChanged.emit(self._done, self._total)
+
     def _start_more(self):
         while self._in_flight < self._max_concurrent and self._queue:
             offset = self._queue.popleft()
@@ -257,24 +789,32 @@ class ImageFetcher(QObject):
                     QNetworkRequest.CacheLoadControlAttribute,
                     QNetworkRequest.AlwaysNetwork,
                 )
-            else:
-                request.setAttribute(
-                    QNetworkRequest.CacheLoadControlAttribute,
-                    QNetworkRequest.PreferNetwork,
-                )
-            headers = self._headers_by_offset.get(offset, {})
-            etag = headers.get("etag")
-            last_modified = headers.get("last_modified")
-            if etag:
-                request.setRawHeader(b"If-None-Match", etag.encode())
-            if last_modified:
-                request.setRawHeader(b"If-Modified-Since", last_modified.encode())
+            # Otherwise leave the default PreferNetwork: the disk cache
+            # then revalidates with If-None-Match/If-Modified-Since and
+            # serves the stored entry on 304. PreferCache would skip
+            # revalidation while an entry looks heuristically fresh
+            # (these images carry Last-Modified but no Cache-Control)
+            # and could keep showing an old cycle.
+            request.setAttribute(
+                QNetworkRequest.HttpPipeliningAllowedAttribute, True
+            )
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
             reply = self.manager.get(request)
             reply.setProperty("offset", offset)
             self._in_flight += 1
 
     def _on_finished(self, reply):
+        if reply.property("probe"):
+            self._on_probe_finished(reply)
+            return
         offset = int(reply.property("offset"))
+        if not self._http2_detected and bool_value(
+            reply.attribute(QNetworkRequest.Http2WasUsedAttribute)
+        ):
+            # Multiplexed streams make the conservative per-connection
+            # gate unnecessary; widen it for the rest of the batch.
+            self._http2_detected = True
+            self._max_concurrent = max(self._max_concurrent, HTTP2_MAX_CONCURRENT)
         status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
         etag = bytes(reply.rawHeader(b"ETag")).decode("utf-8", "ignore").strip()
         last_modified = bytes(reply.rawHeader(b"Last-Modified")).decode(
@@ -286,15 +826,16 @@ class ImageFetcher(QObject):
         if last_modified:
             meta["last_modified"] = last_modified
 
-        if status == 304:
+        from_cache = bool_value(
+            reply.attribute(QNetworkRequest.SourceIsFromCacheAttribute)
+        )
+        if status == 304 or (from_cache and not self._force_network):
             self.notModified.emit(offset)
         elif reply.error() == QNetworkReply.NoError:
-            data = bytes(reply.readAll())
-            pixmap = QPixmap()
-            if pixmap.loadFromData(data):
-                self.imageLoaded.emit(offset, pixmap, meta)
-            else:
-                self.imageError.emit(offset, "invalid image data")
+            # readAll() hands over a QByteArray; keeping it in that form
+            # avoids materializing a Python bytes copy of every image
+            # (QByteArray is implicitly shared, so passing it is cheap).
+            self._decode_async(offset, reply.readAll(), meta)
         else:
             self.imageError.emit(offset, reply.errorString())
 
@@ -303,10 +844,107 @@ class ImageFetcher(QObject):
         self._done += 1
         self.progressChanged.emit(self._done, self._total)
         if self._done == self._total:
-            self.batchFinished.emit()
+            self._finish_network_batch()
         else:
             self._start_more()
 
+    def _finish_network_batch(self):
+        # Decodes trail the network completions on the thread pool;
+        # holding batchFinished until they drain keeps the last
+        # imageLoaded/imageError signals inside the batch.
+        self._network_done = True
+        self._maybe_emit_batch_finished()
+
+    def _maybe_emit_batch_finished(self):
+        if self._network_done and self._decodes_pending == 0:
+            self._network_done = False
+            self.batchFinished.emit()
+
+    def _decode_async(self, offset, data, meta):
+        task = _ReplyDecodeTask(offset, data, meta)
+        task.signals.decoded.connect(self._on_reply_decoded)
+        task.signals.failed.connect(self._on_decode_failed)
+        self._decodes_pending += 1
+        QThreadPool.globalInstance().start(task)
+
+    def _decode_done(self):
+        self._decodes_pending -= 1
+        self._maybe_emit_batch_finished()
+
+    def _on_decode_failed(self, offset, error):
+        self.imageError.emit(offset, error)
+        self._decode_done()
+
+    def _on_reply_decoded(self, offset, image, meta):
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            self.imageError.emit(offset, "invalid image data")
+        else:
+            self.imageLoaded.emit(offset, pixmap, meta)
+        self._decode_done()
+
+
+class Mp4ExportWorker(QThread):
+    """Encode frames to MP4 without blocking the GUI thread.
+
+    A ThreadPoolExecutor converts QImages to RGB arrays in parallel
+    while this thread drains the futures in order into the imageio
+    writer; the pipeline depth bounds how many decoded frames are
+    resident at once. Frames must be passed as QImage — QPixmap is not
+    usable outside the GUI thread.
+    """
+
+    progressChanged = pyqtSignal(int, int)
+    exportFinished = pyqtSignal(bool, str)
+
+    def __init__(self, path, images, fps, crop=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.images = images
+        self.fps = fps
+        self.crop = crop
+
+    def _to_rgb_array(self, image):
+        return qimage_to_rgb_ndarray(image, self.crop)
+
+    def _drain_one(self, writer, pending, done):
+        frame = pending.popleft().result()
+        if frame is not None:
+            writer.append_data(frame)
+        done += 1
+        self.progressChanged.emit(done, len(self.images))
+        return done
+
+    def run(self):
+        try:
+            import imageio
+        except Exception as exc:
+            self.exportFinished.emit(False, str(exc))
+            return
+        try:
+            writer = imageio.get_writer(
+                self.path, fps=self.fps, codec="libx264", macro_block_size=1
+            )
+        except Exception as exc:
+            self.exportFinished.emit(False, str(exc))
+            return
+        error = ""
+        done = 0
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                pending = deque()
+                for image in self.images:
+                    pending.append(executor.submit(self._to_rgb_array, image))
+                    if len(pending) >= EXPORT_PIPELINE_DEPTH:
+                        done = self._drain_one(writer, pending, done)
+                while pending:
+                    done = self._drain_one(writer, pending, done)
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            writer.close()
+        self.exportFinished.emit(not error, error)
+
 
 class ImageView(QGraphicsView):
     selectionChanged = pyqtSignal(QRect)
@@ -379,24 +1017,24 @@ class ImageView(QGraphicsView):
     def _update_pixmap(self):
         if not self._full_pixmap:
             return
-        if self._zoomed and self.has_selection():
-            cropped = self._full_pixmap.copy(self._selection_rect)
-            self._pixmap_item.setPixmap(cropped)
-            self._selection_item.hide()
+        # The full pixmap always stays on the item; zooming only changes
+        # the view transform, so playback never copies cropped pixels.
+        self._pixmap_item.setPixmap(self._full_pixmap)
+        if self.has_selection() and not self._zoomed:
+            self._selection_item.setRect(QRectF(self._selection_rect))
+            self._selection_item.show()
         else:
-            self._pixmap_item.setPixmap(self._full_pixmap)
-            if self.has_selection():
-                self._selection_item.setRect(QRectF(self._selection_rect))
-                self._selection_item.show()
-            else:
-                self._selection_item.hide()
+            self._selection_item.hide()
         self._fit()
 
     def _fit(self):
         if self._pixmap_item.pixmap().isNull():
             return
         self.setSceneRect(self._pixmap_item.boundingRect())
-        self.fitInView(self._pixmap_item, Qt.KeepAspectRatio)
+        if self._zoomed and self.has_selection():
+            self.fitInView(QRectF(self._selection_rect), Qt.KeepAspectRatio)
+        else:
+            self.fitInView(self._pixmap_item, Qt.KeepAspectRatio)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -417,15 +1055,15 @@ class ImageView(QGraphicsView):
     def mouseMoveEvent(self, event):
         if self._dragging and self._origin is not None:
             current = self.mapToScene(event.pos())
-            rect = QRectF(self._origin, current).normalized()
-            bounds = QRectF(
-                0,
-                0,
+            x, y, w, h = clip_rect(
+                self._origin.x(),
+                self._origin.y(),
+                current.x(),
+                current.y(),
                 self._full_pixmap.width(),
                 self._full_pixmap.height(),
             )
-            rect = rect.intersected(bounds)
-            self._selection_item.setRect(rect)
+            self._selection_item.setRect(QRectF(x, y, w, h))
             event.accept()
             return
         super().mouseMoveEvent(event)
@@ -451,17 +1089,29 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("ECMWF Timelapse")
         self.settings = QSettings(APP_ORG, APP_NAME)
-        self.offsets = build_offsets()
-        self.frames = {offset: None for offset in self.offsets}
+        # Offsets are fixed for the app's lifetime; freeze them and
+        # cache the count so playback index arithmetic never re-derives it.
+        self.offsets = tuple(build_offsets())
+        self._n_offsets = len(self.offsets)
+        # Frames are stored positionally, aligned with self.offsets; the
+        # reverse map is only needed when network/cache callbacks hand
+        # back an offset.
+        self.frames = [None] * self._n_offsets
+        self._offset_index = {
+            offset: index for index, offset in enumerate(self.offsets)
+        }
         self.cache_dir = Path(__file__).with_name("cache")
         self.cache = ForecastCache(self.cache_dir)
         self.metadata = MetadataCache(self.cache_dir / "metadata.json")
-        for offset in self.offsets:
-            cached = self.cache.load(offset)
-            if cached:
-                self.frames[offset] = cached
-
-        self.fetcher = ImageFetcher(BASE_URL, self)
+        self._frame_loads_pending = set()
+        # Offsets whose in-memory pixmap was decoded at display size;
+        # OCR and export re-read those from disk at full resolution.
+        self._scaled_frame_offsets = set()
+        # Viewport-sized variants of full-resolution frames, built at
+        # ingestion and dropped when the viewport is resized.
+        self._display_pixmaps = {}
+
+        self.fetcher = ImageFetcher(BASE_URL, self.cache_dir, self)
         self.fetcher.set_max_concurrent(DEFAULT_MAX_CONCURRENT)
         self.fetcher.imageLoaded.connect(self._on_image_loaded)
         self.fetcher.notModified.connect(self._on_image_not_modified)
@@ -469,25 +1119,44 @@ class MainWindow(QMainWindow):
         self.fetcher.progressChanged.connect(self._on_fetch_progress)
         self.fetcher.batchFinished.connect(self._on_batch_finished)
         self._refresh_in_progress = False
+        self._last_refresh_completed_utc = None
 
         self.current_index = 0
         self.loop_mode = LOOP_MODES[0]
         self.play_direction = 1
+        self._rebuild_step_tables()
         self.use_utc = False
         self._selection_ratio = None
         self._pending_selection_ratio = None
         self._ocr_attempted = False
+        self._ocr_generation = 0
         self._ocr_available = self._detect_ocr_available()
         self._export_caps = self._detect_export_backends()
         self._progress_total = 0
         self._progress_updated = 0
         self._progress_unchanged = 0
         self.region_presets = []
+        self._region_presets_json = None
+        # PIL/ndarray views of frames, keyed by QPixmap.cacheKey(); a
+        # frame only changes when a refresh replaces its pixmap, so
+        # re-exports (e.g. after tweaking FPS) skip the marshaling.
+        self._pil_cache = {}
+        self._np_cache = {}
+        self._mp4_worker = None
+        self._export_missing = 0
+        # Priority order depends only on current_index (offsets are
+        # fixed for the app's lifetime), so at most len(offsets) entries.
+        self._priority_cache = {}
+        self._last_render_key = None
+        # Formatted "Prediccion: ..." labels for every offset; rebuilt
+        # only when the base datetime or timezone toggle changes.
+        self._display_strings = []
+        self._display_strings_key = None
 
         self._build_ui()
+        self._setup_timers()
         self._load_settings()
         self._update_current_frame()
-        self._setup_timers()
         self._start_initial_refresh()
 
     def _build_ui(self):
@@ -532,7 +1201,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(playback_settings)
 
         self.slider = QSlider(Qt.Horizontal)
-        self.slider.setRange(0, len(self.offsets) - 1)
+        self.slider.setRange(0, self._n_offsets - 1)
         self.slider.setTickPosition(QSlider.NoTicks)
         layout.addWidget(self.slider)
 
@@ -662,6 +1331,16 @@ class MainWindow(QMainWindow):
         self.refresh_timer.timeout.connect(self.refresh_images)
         self._update_refresh_interval(self.refresh_spin.value())
 
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500)
+        self.save_timer.timeout.connect(self._save_settings)
+
+        self.presets_timer = QTimer(self)
+        self.presets_timer.setSingleShot(True)
+        self.presets_timer.setInterval(250)
+        self.presets_timer.timeout.connect(self._flush_presets)
+
     def _start_initial_refresh(self):
         if self.auto_base_check.isChecked():
             self._apply_auto_base()
@@ -752,7 +1431,7 @@ class MainWindow(QMainWindow):
             self.loop_mode = loop_mode
 
         current_index = self._settings_int("current_index", 0)
-        if 0 <= current_index < len(self.offsets):
+        if 0 <= current_index < self._n_offsets:
             self.current_index = current_index
         self.slider.setValue(self.current_index)
 
@@ -779,6 +1458,16 @@ class MainWindow(QMainWindow):
         )
         self.export_selection_checkbox.setChecked(export_use_selection)
 
+    def _schedule_save(self):
+        # Coalesce the QSettings writes; scrubbing through frames would
+        # otherwise serialize the whole settings block per step.
+        self.save_timer.start()
+
+    def _presets_json(self):
+        if self._region_presets_json is None:
+            self._region_presets_json = json_dumps_compact(self.region_presets)
+        return self._region_presets_json
+
     def _save_settings(self):
         self.settings.setValue("use_utc", self.use_utc)
         self.settings.setValue("speed_ms", self.speed_spin.value())
@@ -802,9 +1491,7 @@ class MainWindow(QMainWindow):
             )
         else:
             self.settings.setValue("selection_ratio", "")
-        self.settings.setValue(
-            "region_presets", json.dumps(self.region_presets)
-        )
+        self.settings.setValue("region_presets", self._presets_json())
         self.settings.sync()
 
     def _get_base_datetime_utc(self):
@@ -827,7 +1514,7 @@ class MainWindow(QMainWindow):
         self._set_base_datetime_utc(last_cycle_utc())
 
     def _detect_base_from_current(self):
-        pixmap = self.frames.get(self.offsets[self.current_index])
+        pixmap = self._full_frame(self.offsets[self.current_index])
         if not pixmap:
             QMessageBox.information(
                 self,
@@ -894,11 +1581,25 @@ class MainWindow(QMainWindow):
     def _on_loop_mode_changed(self, text):
         if text in LOOP_MODES:
             self.loop_mode = text
+            self._rebuild_step_tables()
+
+    def _rebuild_step_tables(self):
+        # Successor indices per direction; the mode only changes the
+        # forward table (clamp vs wrap), so the per-tick handler is a
+        # plain lookup instead of modular arithmetic.
+        count = self._n_offsets
+        last = count - 1
+        if self.loop_mode == "Stop":
+            self._step_forward = [min(index + 1, last) for index in range(count)]
+        else:
+            self._step_forward = [(index + 1) % count for index in range(count)]
+        self._step_backward = [(index - 1) % count for index in range(count)]
 
     def _on_slider_changed(self, value):
         if value != self.current_index:
             self.current_index = value
             self._update_current_frame()
+            self._schedule_save()
 
     def _set_current_index(self, index):
         self.current_index = index
@@ -906,34 +1607,38 @@ class MainWindow(QMainWindow):
         self.slider.setValue(self.current_index)
         self.slider.blockSignals(False)
         self._update_current_frame()
+        self._schedule_save()
 
     def _prev_frame(self):
         self.play_direction = -1
-        self.current_index = (self.current_index - 1) % len(self.offsets)
+        self.current_index = (self.current_index - 1) % self._n_offsets
         self._set_current_index(self.current_index)
 
     def _next_frame_manual(self):
         self.play_direction = 1
-        self.current_index = (self.current_index + 1) % len(self.offsets)
+        self.current_index = (self.current_index + 1) % self._n_offsets
         self._set_current_index(self.current_index)
 
     def _next_frame_auto(self):
-        if self.loop_mode == "Stop" and self.current_index == len(self.offsets) - 1:
+        if self.loop_mode == "Stop" and self.current_index == self._n_offsets - 1:
             self._pause_playback()
             return
         if self.loop_mode == "Ping-pong":
-            if self.play_direction > 0 and self.current_index == len(self.offsets) - 1:
+            if self.play_direction > 0 and self.current_index == self._n_offsets - 1:
                 self.play_direction = -1
             elif self.play_direction < 0 and self.current_index == 0:
                 self.play_direction = 1
-            self.current_index += self.play_direction
+            if self.play_direction > 0:
+                self.current_index = self._step_forward[self.current_index]
+            else:
+                self.current_index = self._step_backward[self.current_index]
         else:
-            self.current_index = (self.current_index + 1) % len(self.offsets)
+            self.current_index = self._step_forward[self.current_index]
         self._set_current_index(self.current_index)
 
     def _jump_hours(self, hours):
         steps = int(hours / 6)
-        self.current_index = (self.current_index + steps) % len(self.offsets)
+        self.current_index = (self.current_index + steps) % self._n_offsets
         self._set_current_index(self.current_index)
 
     def _toggle_zoom(self, checked):
@@ -955,25 +1660,27 @@ class MainWindow(QMainWindow):
         height = pixmap.height()
         if width <= 0 or height <= 0:
             return None
-        return [
-            rect.x() / width,
-            rect.y() / height,
-            rect.width() / width,
-            rect.height() / height,
-        ]
+        return list(
+            _rect_to_ratio_cached(
+                rect.x(), rect.y(), rect.width(), rect.height(), width, height
+            )
+        )
 
     def _ratio_to_rect(self, ratio, pixmap):
         if not pixmap or pixmap.isNull():
             return QRect()
         if not ratio or len(ratio) != 4:
             return QRect()
-        width = pixmap.width()
-        height = pixmap.height()
-        x = max(0, min(width - 1, int(ratio[0] * width)))
-        y = max(0, min(height - 1, int(ratio[1] * height)))
-        w = max(1, min(width - x, int(ratio[2] * width)))
-        h = max(1, min(height - y, int(ratio[3] * height)))
-        return QRect(x, y, w, h)
+        return QRect(
+            *_ratio_to_rect_cached(
+                pixmap.width(),
+                pixmap.height(),
+                ratio[0],
+                ratio[1],
+                ratio[2],
+                ratio[3],
+            )
+        )
 
     def _on_selection_changed(self, rect):
         has_selection = not rect.isNull() and not rect.isEmpty()
@@ -988,20 +1695,132 @@ class MainWindow(QMainWindow):
         if not has_selection and self.zoom_button.isChecked():
             self.zoom_button.setChecked(False)
 
-        pixmap = self.frames.get(self.offsets[self.current_index])
+        pixmap = self._current_display_pixmap()
         if has_selection and pixmap:
             self._selection_ratio = self._rect_to_ratio(rect, pixmap)
         else:
             self._selection_ratio = None
 
+    def _display_target_size(self):
+        size = self.image_view.viewport().size()
+        if size.width() >= 320 and size.height() >= 240:
+            return size
+        return None
+
+    def _full_frame(self, offset):
+        index = self._offset_index[offset]
+        pixmap = self.frames[index]
+        if pixmap is not None and offset not in self._scaled_frame_offsets:
+            return pixmap
+        full = self.cache.load(offset)
+        if full is None:
+            return pixmap
+        # Promote the full-resolution decode so repeat exports reuse
+        # one pixmap (and one cacheKey for the conversion caches)
+        # instead of re-reading the PNG on every call.
+        self.frames[index] = full
+        self._scaled_frame_offsets.discard(offset)
+        self._display_pixmaps.pop(offset, None)
+        return full
+
+    def _display_pixmap_for(self, offset, pixmap):
+        """Viewport-sized variant of a frame for playback rendering.
+
+        Full-resolution pixmaps are downscaled once per offset and
+        reused across ticks, so the view paints a near-1:1 pixmap
+        instead of smooth-scaling the full image every frame. Frames
+        already decoded at display size pass through untouched; OCR
+        and export keep using _full_frame().
+        """
+        target = self._display_target_size()
+        if target is None or pixmap.isNull():
+            return pixmap
+        if (
+            pixmap.width() <= target.width()
+            and pixmap.height() <= target.height()
+        ):
+            return pixmap
+        display = self._display_pixmaps.get(offset)
+        if display is None:
+            display = pixmap.scaled(
+                target, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self._display_pixmaps[offset] = display
+        return display
+
+    def _current_display_pixmap(self):
+        pixmap = self.frames[self.current_index]
+        if pixmap is None:
+            return None
+        return self._display_pixmap_for(
+            self.offsets[self.current_index], pixmap
+        )
+
+    def _ensure_frame_loaded(self, offset):
+        if self.frames[self._offset_index[offset]] is not None:
+            return
+        if offset in self._frame_loads_pending:
+            return
+        target_size = self._display_target_size()
+        if self.cache.load_async(
+            offset,
+            self._on_cache_frame_loaded,
+            self._on_cache_frame_failed,
+            target_size=target_size,
+        ):
+            self._frame_loads_pending.add(offset)
+            if target_size is not None:
+                self._scaled_frame_offsets.add(offset)
+
+    def _prefetch_neighbor_frames(self):
+        total = self._n_offsets
+        for delta in range(1, NEIGHBOR_PREFETCH + 1):
+            self._ensure_frame_loaded(
+                self.offsets[(self.current_index + delta) % total]
+            )
+            self._ensure_frame_loaded(
+                self.offsets[(self.current_index - delta) % total]
+            )
+
+    def _on_cache_frame_loaded(self, offset, image):
+        self._frame_loads_pending.discard(offset)
+        index = self._offset_index[offset]
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull() or self.frames[index] is not None:
+            self._scaled_frame_offsets.discard(offset)
+            return
+        self.frames[index] = pixmap
+        if index == self.current_index:
+            self._update_current_frame()
+
+    def _on_cache_frame_failed(self, offset):
+        self._frame_loads_pending.discard(offset)
+        self._scaled_frame_offsets.discard(offset)
+
     def _update_current_frame(self):
         offset = self.offsets[self.current_index]
-        pixmap = self.frames.get(offset)
-        if pixmap:
-            self.image_view.set_pixmap(pixmap)
+        pixmap = self.frames[self.current_index]
+        if pixmap is None:
+            self._ensure_frame_loaded(offset)
+        self._prefetch_neighbor_frames()
+        display = self._display_pixmap_for(offset, pixmap) if pixmap else None
+        base_utc = self._get_base_datetime_utc()
+        render_key = (
+            self.current_index,
+            display.cacheKey() if display else None,
+            self.use_utc,
+            base_utc.toMSecsSinceEpoch(),
+        )
+        # Redundant signals (slider echoes, repeated timer ticks on a
+        # single frame) land here with nothing visible to change.
+        if render_key == self._last_render_key and not self._pending_selection_ratio:
+            return
+        self._last_render_key = render_key
+        if display:
+            self.image_view.set_pixmap(display)
             if self._pending_selection_ratio:
                 rect = self._ratio_to_rect(
-                    self._pending_selection_ratio, pixmap
+                    self._pending_selection_ratio, display
                 )
                 self.image_view.set_selection_rect(rect, emit_signal=False)
                 self._pending_selection_ratio = None
@@ -1011,21 +1830,32 @@ class MainWindow(QMainWindow):
             self.image_view.set_pixmap(QPixmap())
             self.status_label.setText("Estado: imagen no disponible")
 
-        base_utc = self._get_base_datetime_utc()
-        forecast_utc = base_utc.addSecs(offset * 3600)
-        if self.use_utc:
-            display_dt = forecast_utc.toUTC()
-            tz_label = "UTC"
-        else:
-            display_dt = forecast_utc.toLocalTime()
-            tz_label = "Local"
-        self.time_label.setText(
-            "Prediccion: {dt} {tz} (T+{offset:03d}h)".format(
-                dt=display_dt.toString("dd/MM/yyyy HH:mm"),
-                tz=tz_label,
-                offset=offset,
+        self.time_label.setText(self._display_string(base_utc))
+
+    def _display_string(self, base_utc):
+        key = (base_utc.toMSecsSinceEpoch(), self.use_utc)
+        if key != self._display_strings_key:
+            self._rebuild_display_strings(base_utc)
+            self._display_strings_key = key
+        return self._display_strings[self.current_index]
+
+    def _rebuild_display_strings(self, base_utc):
+        tz_label = "UTC" if self.use_utc else "Local"
+        strings = []
+        for offset in self.offsets:
+            forecast_utc = base_utc.addSecs(offset * 3600)
+            if self.use_utc:
+                display_dt = forecast_utc.toUTC()
+            else:
+                display_dt = forecast_utc.toLocalTime()
+            strings.append(
+                "Prediccion: {dt} {tz} (T+{offset:03d}h)".format(
+                    dt=display_dt.toString("dd/MM/yyyy HH:mm"),
+                    tz=tz_label,
+                    offset=offset,
+                )
             )
-        )
+        self._display_strings = strings
 
     def _update_refresh_interval(self, minutes):
         self.refresh_timer.setInterval(minutes * 60 * 1000)
@@ -1033,7 +1863,7 @@ class MainWindow(QMainWindow):
             self.refresh_timer.start()
 
     def _build_priority_offsets(self):
-        total = len(self.offsets)
+        total = self._n_offsets
         order = []
         seen = set()
 
@@ -1053,12 +1883,27 @@ class MainWindow(QMainWindow):
                 seen.add(offset)
         return order
 
+    def _refresh_still_fresh(self):
+        last = self._last_refresh_completed_utc
+        if last is None or None in self.frames:
+            return False
+        now = QDateTime.currentDateTimeUtc()
+        if last.secsTo(now) > REFRESH_FRESH_SECS:
+            return False
+        return last_cycle_utc(last) == last_cycle_utc(now)
+
     def refresh_images(self):
         if self._refresh_in_progress:
             return
+        # The source publishes per forecast cycle; a refresh that just
+        # completed within the same cycle cannot find anything new, so
+        # skip the round of conditional requests entirely.
+        if self._refresh_still_fresh():
+            self.status_label.setText("Estado: imagenes al dia")
+            return
         self._refresh_in_progress = True
         self._ocr_attempted = False
-        self._progress_total = len(self.offsets)
+        self._progress_total = self._n_offsets
         self._progress_updated = 0
         self._progress_unchanged = 0
         self.progress_label.setText(
@@ -1068,14 +1913,17 @@ class MainWindow(QMainWindow):
             self._apply_auto_base()
         self.status_label.setText("Estado: actualizando imagenes...")
 
-        headers_by_offset = {
-            offset: self.metadata.headers_for(offset)
-            for offset in self.offsets
-        }
+        priority_offsets = self._priority_cache.get(self.current_index)
+        if priority_offsets is None:
+            priority_offsets = self._build_priority_offsets()
+            self._priority_cache[self.current_index] = priority_offsets
+        probe_last_modified = self.metadata.last_modified_for(
+            priority_offsets[0]
+        )
         self.fetcher.fetch_offsets(
-            self._build_priority_offsets(),
-            headers_by_offset=headers_by_offset,
+            priority_offsets,
             force_network=False,
+            probe_last_modified=probe_last_modified,
         )
 
     def _on_fetch_progress(self, done, total):
@@ -1093,15 +1941,31 @@ class MainWindow(QMainWindow):
         if offset != self.offsets[self.current_index] and offset != self.offsets[0]:
             return
         self._ocr_attempted = True
-        ocr_dt = try_ocr_datetime(pixmap)
-        if not ocr_dt:
+        self._ocr_generation += 1
+        # QPixmap cannot leave the GUI thread; hand the task a QImage.
+        task = _OcrTask(self._ocr_generation, offset, pixmap.toImage())
+        task.signals.done.connect(self._on_ocr_done)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_ocr_done(self, generation, offset, ocr_dt):
+        if generation != self._ocr_generation:
+            return
+        if not ocr_dt.isValid():
             return
         base_utc = ocr_dt.addSecs(-offset * 3600)
         self._set_base_datetime_utc(base_utc)
         self.status_label.setText("Estado: base ajustada por OCR")
 
     def _on_image_loaded(self, offset, pixmap, meta):
-        self.frames[offset] = pixmap
+        index = self._offset_index[offset]
+        old_pixmap = self.frames[index]
+        if old_pixmap is not None:
+            self._pil_cache.pop(old_pixmap.cacheKey(), None)
+            self._np_cache.pop(old_pixmap.cacheKey(), None)
+        self.frames[index] = pixmap
+        self._scaled_frame_offsets.discard(offset)
+        self._display_pixmaps.pop(offset, None)
+        self._display_pixmap_for(offset, pixmap)
         self.cache.save(offset, pixmap)
         self.metadata.update(
             offset, meta.get("etag"), meta.get("last_modified")
@@ -1113,6 +1977,7 @@ class MainWindow(QMainWindow):
 
     def _on_image_not_modified(self, offset):
         self._progress_unchanged += 1
+        self._ensure_frame_loaded(offset)
 
     def _on_image_error(self, offset, error_text):
         if offset == self.offsets[self.current_index]:
@@ -1120,10 +1985,15 @@ class MainWindow(QMainWindow):
 
     def _on_batch_finished(self):
         self._refresh_in_progress = False
+        if (
+            self._progress_updated > 0
+            or self._progress_unchanged == self._progress_total
+        ):
+            self._last_refresh_completed_utc = QDateTime.currentDateTimeUtc()
         now = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm")
         self.update_label.setText(f"Ultima actualizacion: {now}")
         self.metadata.save()
-        if not self.frames.get(self.offsets[self.current_index]):
+        if not self.frames[self.current_index]:
             self.status_label.setText("Estado: imagen no disponible")
 
     def _update_region_combo(self):
@@ -1141,7 +2011,7 @@ class MainWindow(QMainWindow):
         ratio = preset.get("ratio")
         if not ratio:
             return
-        pixmap = self.frames.get(self.offsets[self.current_index])
+        pixmap = self._current_display_pixmap()
         if pixmap:
             rect = self._ratio_to_rect(ratio, pixmap)
             self.image_view.set_selection_rect(rect)
@@ -1160,29 +2030,66 @@ class MainWindow(QMainWindow):
         )
         if not ok or not name.strip():
             return
-        pixmap = self.frames.get(self.offsets[self.current_index])
+        pixmap = self._current_display_pixmap()
         ratio = self._rect_to_ratio(rect, pixmap)
         if not ratio:
             return
         self.region_presets.append({"name": name.strip(), "ratio": ratio})
+        self._region_presets_json = None
         self._update_region_combo()
-        self.settings.setValue(
-            "region_presets", json.dumps(self.region_presets)
-        )
+        self.presets_timer.start()
 
     def _delete_region_preset(self):
         index = self.region_combo.currentIndex()
         if index <= 0:
             return
         self.region_presets.pop(index - 1)
+        self._region_presets_json = None
         self._update_region_combo()
-        self.settings.setValue(
-            "region_presets", json.dumps(self.region_presets)
-        )
+        self.presets_timer.start()
+
+    def _flush_presets(self):
+        self.settings.setValue("region_presets", self._presets_json())
+
+    def _cache_put(self, cache, key, value):
+        # One entry per offset is the steady state; full-resolution
+        # reloads mint new cache keys, so evict the oldest insertion
+        # once the pool outgrows the frame count.
+        while len(cache) >= self._n_offsets:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _get_pil(self, pixmap):
+        key = pixmap.cacheKey()
+        pil_image = self._pil_cache.get(key)
+        if pil_image is None:
+            pil_image = pixmap_to_pil(pixmap)
+            if pil_image is not None:
+                self._cache_put(self._pil_cache, key, pil_image)
+        return pil_image
+
+    def _get_rgb_array(self, pixmap):
+        try:
+            import numpy as np
+        except Exception:
+            return None
+        key = pixmap.cacheKey()
+        array = self._np_cache.get(key)
+        if array is None:
+            pil_image = self._get_pil(pixmap)
+            if pil_image is None:
+                return None
+            array = np.asarray(pil_image.convert("RGB"))
+            self._cache_put(self._np_cache, key, array)
+        return array
 
     def _collect_export_frames(self, use_selection):
-        frames = []
-        missing = 0
+        """Gather full-resolution frames for export.
+
+        Cropping is left to the exporters (PIL crop or ndarray slice on
+        an already-converted frame) so no per-frame QPixmap deep copy is
+        made here.
+        """
         rect = None
         if use_selection:
             rect = self.image_view.selection_rect()
@@ -1192,19 +2099,31 @@ class MainWindow(QMainWindow):
                     "Export",
                     "No hay seleccion activa para exportar.",
                 )
-                return [], 0
-        for offset in self.offsets:
-            pixmap = self.frames.get(offset)
-            if not pixmap:
-                missing += 1
-                continue
-            if rect:
-                pixmap = pixmap.copy(rect)
-            frames.append(pixmap)
-        return frames, missing
+                return [], None, 0
+        pixmaps = [self._full_frame(offset) for offset in self.offsets]
+        missing = pixmaps.count(None)
+        frames = [pixmap for pixmap in pixmaps if pixmap is not None]
+        if rect is not None and frames:
+            rect = self._map_selection_to_full(rect, frames[0])
+        return frames, rect, missing
+
+    def _map_selection_to_full(self, rect, full_pixmap):
+        """Translate a selection from display to full-frame coordinates.
+
+        The view may show a downscaled variant, so the raw selection
+        rect lives in that pixmap's space; route it through the ratio
+        helpers against the full-resolution frame before cropping.
+        """
+        display = self._current_display_pixmap()
+        if display is None or display.size() == full_pixmap.size():
+            return rect
+        ratio = self._rect_to_ratio(rect, display)
+        if not ratio:
+            return rect
+        return self._ratio_to_rect(ratio, full_pixmap)
 
     def _export_snapshot(self):
-        pixmap = self.frames.get(self.offsets[self.current_index])
+        pixmap = self._full_frame(self.offsets[self.current_index])
         if not pixmap:
             QMessageBox.information(
                 self, "Snapshot", "No hay imagen disponible."
@@ -1213,13 +2132,26 @@ class MainWindow(QMainWindow):
         if self.export_selection_checkbox.isChecked():
             rect = self.image_view.selection_rect()
             if not rect.isNull() and not rect.isEmpty():
-                pixmap = pixmap.copy(rect)
+                pixmap = pixmap.copy(
+                    self._map_selection_to_full(rect, pixmap)
+                )
         path, _ = QFileDialog.getSaveFileName(
             self, "Guardar snapshot", "snapshot.png", "PNG (*.png)"
         )
         if not path:
             return
-        pixmap.save(path, "PNG")
+        # PNG encoding a full frame is CPU-bound; run it on the pool.
+        # QPixmap is not thread-safe, so hand over a QImage.
+        task = _PngSaveTask(pixmap.toImage(), path)
+        task.signals.saved.connect(self._on_snapshot_saved)
+        QThreadPool.globalInstance().start(task)
+        self.status_label.setText("Estado: guardando snapshot...")
+
+    def _on_snapshot_saved(self, path, ok):
+        if ok:
+            self.status_label.setText(f"Estado: snapshot guardado en {path}")
+        else:
+            self.status_label.setText("Estado: fallo al guardar snapshot")
 
     def _export_gif(self):
         if not (
@@ -1233,7 +2165,7 @@ class MainWindow(QMainWindow):
             )
             return
         use_selection = self.export_selection_checkbox.isChecked()
-        frames, missing = self._collect_export_frames(use_selection)
+        frames, rect, missing = self._collect_export_frames(use_selection)
         if not frames:
             return
         path, _ = QFileDialog.getSaveFileName(
@@ -1243,6 +2175,14 @@ class MainWindow(QMainWindow):
             return
         fps = self.export_fps_spin.value()
         duration_ms = int(1000 / fps)
+        crop_box = None
+        if rect:
+            crop_box = (
+                rect.x(),
+                rect.y(),
+                rect.x() + rect.width(),
+                rect.y() + rect.height(),
+            )
         if self._export_caps["pil"]:
             try:
                 from PIL import Image
@@ -1255,7 +2195,7 @@ class MainWindow(QMainWindow):
                 return
             pil_frames = []
             for frame in frames:
-                pil_image = pixmap_to_pil(frame)
+                pil_image = self._get_pil(frame)
                 if pil_image is None:
                     QMessageBox.information(
                         self,
@@ -1263,6 +2203,8 @@ class MainWindow(QMainWindow):
                         "No se pudo convertir a imagen.",
                     )
                     return
+                if crop_box:
+                    pil_image = pil_image.crop(crop_box)
                 pil_frames.append(pil_image)
             if not pil_frames:
                 return
@@ -1292,20 +2234,12 @@ class MainWindow(QMainWindow):
                     "Instala imageio y numpy para exportar GIF.",
                 )
                 return
-            frames_np = []
-            for frame in frames:
-                pil_image = pixmap_to_pil(frame)
-                if pil_image is None:
-                    continue
-                frames_np.append(np.asarray(pil_image.convert("RGB")))
-            if not frames_np:
-                return
+            # Stream each frame straight into the encoder so peak
+            # residency is one cropped frame, not a (T, H, W, 3) tensor;
+            # mirrors how the MP4 worker feeds its writer.
             try:
-                imageio.mimsave(
-                    path,
-                    frames_np,
-                    format="GIF",
-                    duration=1.0 / fps,
+                writer = imageio.get_writer(
+                    path, format="GIF", duration=1.0 / fps
                 )
             except Exception as exc:
                 QMessageBox.information(
@@ -1314,6 +2248,33 @@ class MainWindow(QMainWindow):
                     f"Fallo al guardar GIF: {exc}",
                 )
                 return
+            valid = 0
+            error = ""
+            try:
+                for frame in frames:
+                    frame_np = self._get_rgb_array(frame)
+                    if frame_np is None:
+                        continue
+                    if rect:
+                        frame_np = frame_np[
+                            rect.y() : rect.y() + rect.height(),
+                            rect.x() : rect.x() + rect.width(),
+                        ]
+                    writer.append_data(frame_np)
+                    valid += 1
+            except Exception as exc:
+                error = str(exc)
+            finally:
+                writer.close()
+            if error:
+                QMessageBox.information(
+                    self,
+                    "Export GIF",
+                    f"Fallo al guardar GIF: {error}",
+                )
+                return
+            if valid == 0:
+                return
         if missing:
             self.status_label.setText(
                 f"Estado: GIF exportado, faltan {missing} frames."
@@ -1334,7 +2295,7 @@ class MainWindow(QMainWindow):
             )
             return
         use_selection = self.export_selection_checkbox.isChecked()
-        frames, missing = self._collect_export_frames(use_selection)
+        frames, rect, missing = self._collect_export_frames(use_selection)
         if not frames:
             return
         path, _ = QFileDialog.getSaveFileName(
@@ -1343,36 +2304,34 @@ class MainWindow(QMainWindow):
         if not path:
             return
         fps = self.export_fps_spin.value()
-        try:
-            import imageio
-            import numpy as np
-        except Exception:
-            QMessageBox.information(
-                self,
-                "Export MP4",
-                "Instala imageio y numpy para exportar MP4.",
-            )
-            return
-        try:
-            writer = imageio.get_writer(path, fps=fps, codec="libx264")
-        except Exception as exc:
+        # QPixmap cannot cross threads; convert on the GUI thread once.
+        images = [frame.toImage() for frame in frames]
+        crop = rect.getRect() if rect else None
+        self._export_missing = missing
+        self._mp4_worker = Mp4ExportWorker(path, images, fps, crop, self)
+        self._mp4_worker.progressChanged.connect(self._on_export_progress)
+        self._mp4_worker.exportFinished.connect(self._on_mp4_export_finished)
+        self.mp4_button.setEnabled(False)
+        self.status_label.setText("Estado: exportando MP4...")
+        self._mp4_worker.start()
+
+    def _on_export_progress(self, done, total):
+        self.progress_label.setText(f"Progreso: {done}/{total}")
+
+    def _on_mp4_export_finished(self, ok, error_text):
+        self.mp4_button.setEnabled(True)
+        self._mp4_worker = None
+        if not ok:
+            self.status_label.setText("Estado: fallo al exportar MP4")
             QMessageBox.information(
                 self,
                 "Export MP4",
-                f"No se pudo iniciar el writer: {exc}",
+                f"Fallo al guardar MP4: {error_text}",
             )
             return
-        try:
-            for frame in frames:
-                pil_image = pixmap_to_pil(frame)
-                if pil_image is None:
-                    continue
-                writer.append_data(np.asarray(pil_image.convert("RGB")))
-        finally:
-            writer.close()
-        if missing:
+        if self._export_missing:
             self.status_label.setText(
-                f"Estado: MP4 exportado, faltan {missing} frames."
+                f"Estado: MP4 exportado, faltan {self._export_missing} frames."
             )
         else:
             self.status_label.setText("Estado: MP4 exportado")
@@ -1404,7 +2363,7 @@ class MainWindow(QMainWindow):
             event.accept()
             return
         if key == Qt.Key_End:
-            self._set_current_index(len(self.offsets) - 1)
+            self._set_current_index(self._n_offsets - 1)
             event.accept()
             return
         if key == Qt.Key_Z:
@@ -1416,13 +2375,54 @@ class MainWindow(QMainWindow):
             return
         super().keyPressEvent(event)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        stale = bool(self._display_pixmaps)
+        self._display_pixmaps.clear()
+        target = self._display_target_size()
+        if target is not None:
+            # Frames decoded at a smaller viewport's display size would
+            # now be shown upscaled; drop them so _ensure_frame_loaded
+            # re-decodes at the new size. A correctly sized decode
+            # matches the target in at least one dimension.
+            for offset in list(self._scaled_frame_offsets):
+                pixmap = self.frames[self._offset_index[offset]]
+                if pixmap is None:
+                    continue
+                if (
+                    pixmap.width() < target.width()
+                    and pixmap.height() < target.height()
+                ):
+                    self.frames[self._offset_index[offset]] = None
+                    self._scaled_frame_offsets.discard(offset)
+                    stale = True
+        if stale:
+            # The selection rect lives in display-pixmap coordinates,
+            # which just changed size; stash its ratio and let the
+            # pending-restore path reproject it onto the rebuilt pixmap.
+            if self._selection_ratio:
+                self._pending_selection_ratio = self._selection_ratio
+                self.image_view.set_selection_rect(QRect(), emit_signal=False)
+            self._last_render_key = None
+            self._update_current_frame()
+
     def closeEvent(self, event):
+        self.presets_timer.stop()
+        self._flush_presets()
         self._save_settings()
         super().closeEvent(event)
 
 
 def main():
     app = QApplication(sys.argv)
+    if aiohttp is not None and qasync is not None:
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        window = MainWindow()
+        window.resize(1300, 900)
+        window.show()
+        with loop:
+            sys.exit(loop.run_forever())
     window = MainWindow()
     window.resize(1300, 900)
     window.show()